@@ -1,18 +1,48 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, make_response, abort
 from flask_cors import CORS
-from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
+from datetime import datetime, timedelta
+from werkzeug.security import generate_password_hash, check_password_hash, safe_join
 import sqlite3
 import os
 import io
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER
-
-app = Flask(__name__)
+import gzip
+import json
+import mimetypes
+import threading
+import time
+import build_assets
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BUILD_DIR = os.path.join(BASE_DIR, "build")
+ASSET_MANIFEST = os.path.join(BUILD_DIR, "static", "manifest.json")
+
+HASHED_ASSETS = set()
+
+
+def load_asset_manifest():
+    # Returns True when build/ no longer matches the source files it was built from
+    with open(ASSET_MANIFEST, encoding="utf-8") as f:
+        manifest = json.load(f)
+    HASHED_ASSETS.clear()
+    HASHED_ASSETS.update(manifest.get("assets", {}).values())
+    return manifest.get("sources") != build_assets.source_hashes()
+
+
+# Serve the output of build_assets.py when present, otherwise the plain sources
+if os.path.exists(ASSET_MANIFEST):
+    app = Flask(__name__, static_folder=None, template_folder=os.path.join(BUILD_DIR, "templates"))
+    STATIC_DIR = os.path.join(BUILD_DIR, "static")
+    ASSETS_STALE = load_asset_manifest()
+    if ASSETS_STALE:
+        app.logger.warning(
+            "build/ is out of date with index.html/style.css/script.js/img.jpeg and is serving "
+            "old assets. Re-run `python build_assets.py` (python app.py does this automatically)."
+        )
+else:
+    app = Flask(__name__, static_folder=None)
+    STATIC_DIR = os.path.join(app.root_path, "static")
+    ASSETS_STALE = False
+
 CORS(app)
 
 DATABASE = "billing_system.db"
@@ -23,17 +53,38 @@ SALARY_RATES = {
     "lab": 400
 }
 
-COLLEGE_NAME = "LOKNETE SHAMRAO PEJE GOVERNMENT COLLEGE OF ENGINEERING, RATNAGIRI"
+# Hashed filenames change whenever their content does, so they can be cached for a year
+STATIC_MAX_AGE = 365 * 24 * 60 * 60
 
+# Precompressed variants written by build_assets.py, in order of preference
+STATIC_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
 
-def init_db():
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    cursor.execute('PRAGMA journal_mode=WAL')
-    cursor.execute('PRAGMA busy_timeout=5000')
-    cursor.execute('PRAGMA foreign_keys = ON')
+# Background maintenance (see run_maintenance)
+MAINTENANCE_INTERVAL_SECONDS = 60
+WAL_PASSIVE_CHECKPOINT_BYTES = 4 * 1024 * 1024
+WAL_TRUNCATE_CHECKPOINT_BYTES = 64 * 1024 * 1024
+OPTIMIZE_INTERVAL = timedelta(hours=6)
+OFF_PEAK_HOURS = range(1, 5)
+INCREMENTAL_VACUUM_MIN_FREE_PAGES = 256
+INCREMENTAL_VACUUM_PAGES = 2000
+MAINTENANCE_LOG_RETENTION = timedelta(days=30)
+MAINTENANCE_ERROR_BACKOFF = timedelta(minutes=5)
+MAINTENANCE_ERROR_BACKOFF_MAX = timedelta(hours=6)
 
-    cursor.execute("""
+# Offline clients flush queued edits in batches of at most this many operations
+SYNC_BATCH_LIMIT = 100
+
+# How long applied op_ids are remembered so retried batches stay idempotent
+APPLIED_OPS_RETENTION = timedelta(days=30)
+
+COLLEGE_NAME = "LOKNETE SHAMRAO PEJE GOVERNMENT COLLEGE OF ENGINEERING, RATNAGIRI"
+
+
+# Each entry upgrades the schema by one version; PRAGMA user_version records
+# how many have been applied. Append new steps, never edit applied ones.
+MIGRATIONS = [
+    [
+        """
         CREATE TABLE IF NOT EXISTS users(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE NOT NULL,
@@ -41,27 +92,24 @@ def init_db():
             password TEXT NOT NULL,
             role TEXT NOT NULL
         )
-    """)
-
-    cursor.execute("""
+        """,
+        """
         CREATE TABLE IF NOT EXISTS faculty(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             email TEXT NOT NULL,
             department TEXT NOT NULL
         )
-    """)
-
-    cursor.execute("""
+        """,
+        """
         CREATE TABLE IF NOT EXISTS subjects(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             faculty_id INTEGER NOT NULL,
             FOREIGN KEY (faculty_id) REFERENCES faculty(id) ON DELETE CASCADE
         )
-    """)
-
-    cursor.execute("""
+        """,
+        """
         CREATE TABLE IF NOT EXISTS daily_workload(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             faculty_id INTEGER NOT NULL,
@@ -76,15 +124,94 @@ def init_db():
             FOREIGN KEY (faculty_id) REFERENCES faculty(id) ON DELETE CASCADE,
             FOREIGN KEY (subject_id) REFERENCES subjects(id) ON DELETE CASCADE
         )
-    """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_workload_faculty_date 
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_workload_faculty_date
         ON daily_workload(faculty_id, work_date)
-    """)
+        """,
+    ],
+    [
+        # faculty_subjects, and ON DELETE CASCADE from faculty
+        "CREATE INDEX IF NOT EXISTS idx_subjects_faculty ON subjects(faculty_id)",
+        # ON DELETE CASCADE from subjects
+        "CREATE INDEX IF NOT EXISTS idx_workload_subject ON daily_workload(subject_id)",
+        # faculty lookup by login email in manage_faculty
+        "CREATE INDEX IF NOT EXISTS idx_faculty_email_lower ON faculty(lower(email))",
+    ],
+    [
+        # op_ids from offline clients already applied by sync_workload, unique per faculty
+        """
+        CREATE TABLE IF NOT EXISTS applied_ops(
+            op_id TEXT NOT NULL,
+            faculty_id INTEGER NOT NULL,
+            entry_id INTEGER,
+            applied_at TEXT NOT NULL,
+            PRIMARY KEY (faculty_id, op_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_applied_ops_applied_at ON applied_ops(applied_at)",
+    ],
+    [
+        # one row per maintenance task run, see run_maintenance; status is running / ok / error
+        """
+        CREATE TABLE IF NOT EXISTS maintenance_log(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task TEXT NOT NULL,
+            ran_at TEXT NOT NULL,
+            duration_ms REAL NOT NULL,
+            details TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'ok'
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_maintenance_log_task ON maintenance_log(task, ran_at)",
+    ],
+]
 
-    conn.commit()
-    conn.close()
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def migrate_db():
+    conn = sqlite3.connect(DATABASE, timeout=10)
+    try:
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return version
+
+        # Only takes effect before the first table exists; older files are switched
+        # over by vacuum_db during an off-peak window
+        if version == 0:
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+
+        # WAL is persistent in the file, so this only needs to happen when migrating.
+        # Readers keep working while each step below builds its indexes.
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA foreign_keys = ON')
+
+        while version < SCHEMA_VERSION:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                # another worker may have migrated while we waited for the lock
+                version = conn.execute('PRAGMA user_version').fetchone()[0]
+                if version < SCHEMA_VERSION:
+                    for statement in MIGRATIONS[version]:
+                        conn.execute(statement)
+                    version += 1
+                    conn.execute(f'PRAGMA user_version = {version}')
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        return version
+    finally:
+        conn.close()
+
+
+def warm_up():
+    # Optional: load the PDF stack before the first receipt request,
+    # e.g. with WARM_UP_PDF=1 (see boot_worker)
+    import reportlab.platypus  # noqa: F401
+    import reportlab.lib.styles  # noqa: F401
 
 
 def get_db():
@@ -95,6 +222,224 @@ def get_db():
     return conn
 
 
+# MAINTENANCE
+_maintenance_thread = None
+_maintenance_stop = threading.Event()
+
+
+def wal_size():
+    try:
+        return os.path.getsize(DATABASE + "-wal")
+    except OSError:
+        return 0
+
+
+def pragma_value(conn, name):
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def last_maintenance(conn, task):
+    # Finished or in-progress runs count; failed ones are handled by maintenance_backoff
+    row = conn.execute("""
+        SELECT MAX(ran_at) FROM maintenance_log WHERE task = ? AND status != 'error'
+    """, (task,)).fetchone()
+    return datetime.fromisoformat(row[0]) if row[0] else None
+
+
+def maintenance_backoff(conn, task):
+    # After consecutive failures, wait 5 min, 10 min, 20 min ... up to 6 h before retrying
+    rows = conn.execute("""
+        SELECT ran_at, status FROM maintenance_log WHERE task = ? ORDER BY id DESC LIMIT 16
+    """, (task,)).fetchall()
+
+    failures = 0
+    for _, status in rows:
+        if status != "error":
+            break
+        failures += 1
+
+    if failures == 0:
+        return False
+
+    wait = min(MAINTENANCE_ERROR_BACKOFF * 2 ** (failures - 1), MAINTENANCE_ERROR_BACKOFF_MAX)
+    return datetime.now() < datetime.fromisoformat(rows[0][0]) + wait
+
+
+def claim_maintenance(conn, task, due):
+    # The due check and the "running" row happen under one write lock, so when several
+    # workers run the scheduler only the first to get here runs the task
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+    except sqlite3.OperationalError:
+        return None  # another connection holds the write lock, e.g. mid-VACUUM
+
+    try:
+        if maintenance_backoff(conn, task) or not due(conn):
+            conn.execute("ROLLBACK")
+            return None
+
+        cursor = conn.execute("""
+            INSERT INTO maintenance_log(task, ran_at, duration_ms, details, status)
+            VALUES (?, ?, 0, '{}', 'running')
+        """, (task, datetime.now().isoformat(timespec="seconds")))
+        conn.execute("COMMIT")
+        return cursor.lastrowid
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def finish_maintenance(conn, run_id, started, details, status):
+    duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    conn.execute("""
+        UPDATE maintenance_log SET duration_ms = ?, details = ?, status = ?
+        WHERE id = ?
+    """, (duration_ms, json.dumps(details), status, run_id))
+
+
+def checkpoint_due(conn):
+    return wal_size() >= WAL_PASSIVE_CHECKPOINT_BYTES
+
+
+def checkpoint_wal(conn):
+    before = wal_size()
+    details = {"wal_bytes_before": before}
+
+    if before < WAL_TRUNCATE_CHECKPOINT_BYTES:
+        # PASSIVE copies what it can without waiting on readers or writers
+        busy, log_frames, checkpointed = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        details["passive"] = {"busy": bool(busy), "log_frames": log_frames, "checkpointed_frames": checkpointed}
+        details["mode"] = "passive"
+        # Nothing left to copy, so truncating the file is cheap; otherwise it would stay this size
+        run_truncate = not busy and log_frames == checkpointed
+    else:
+        details["mode"] = "truncate"
+        run_truncate = True
+
+    if run_truncate:
+        busy, log_frames, checkpointed = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        details["truncate"] = {"busy": bool(busy), "log_frames": log_frames, "checkpointed_frames": checkpointed}
+
+    details["wal_bytes_after"] = wal_size()
+    return details
+
+
+def optimize_due(conn):
+    last = last_maintenance(conn, "optimize")
+    return last is None or datetime.now() - last >= OPTIMIZE_INTERVAL
+
+
+def optimize_db(conn):
+    has_stats = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+
+    # PRAGMA optimize only re-analyzes tables whose stats look stale, so the
+    # very first run needs a full ANALYZE to give the planner anything at all
+    if has_stats:
+        conn.execute("PRAGMA optimize")
+    else:
+        conn.execute("ANALYZE")
+
+    analyzed = conn.execute("SELECT COUNT(DISTINCT tbl) FROM sqlite_stat1").fetchone()[0]
+    return {"full_analyze": not has_stats, "tables_with_stats": analyzed}
+
+
+def vacuum_due(conn):
+    return (datetime.now().hour in OFF_PEAK_HOURS
+            and pragma_value(conn, "freelist_count") >= INCREMENTAL_VACUUM_MIN_FREE_PAGES)
+
+
+def vacuum_db(conn):
+    free_before = pragma_value(conn, "freelist_count")
+    page_size = pragma_value(conn, "page_size")
+    pages_before = pragma_value(conn, "page_count")
+
+    if pragma_value(conn, "auto_vacuum") != 2:
+        # Databases created before migrations switched auto_vacuum on need one full VACUUM
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        mode = "full"
+    else:
+        # execute() steps the pragma once and frees a single page; executescript runs it to completion
+        conn.executescript(f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGES});")
+        mode = "incremental"
+
+    pages_after = pragma_value(conn, "page_count")
+    return {
+        "mode": mode,
+        "free_pages_before": free_before,
+        "free_pages_after": pragma_value(conn, "freelist_count"),
+        "bytes_reclaimed": (pages_before - pages_after) * page_size
+    }
+
+
+# task name in maintenance_log -> (is it due?, run it and return details)
+MAINTENANCE_TASKS = {
+    "checkpoint": (checkpoint_due, checkpoint_wal),
+    "optimize": (optimize_due, optimize_db),
+    "vacuum": (vacuum_due, vacuum_db),
+}
+
+
+def run_maintenance():
+    # autocommit, so checkpoints and VACUUM never run inside a transaction
+    conn = sqlite3.connect(DATABASE, timeout=2, isolation_level=None)
+    try:
+        for task, (due, run) in MAINTENANCE_TASKS.items():
+            run_id = claim_maintenance(conn, task, due)
+            if run_id is None:
+                continue
+
+            started = time.perf_counter()
+            try:
+                finish_maintenance(conn, run_id, started, run(conn), "ok")
+            except sqlite3.Error as e:
+                finish_maintenance(conn, run_id, started, {"error": str(e)}, "error")
+
+        conn.execute("DELETE FROM maintenance_log WHERE ran_at < ?",
+                     ((datetime.now() - MAINTENANCE_LOG_RETENTION).isoformat(timespec="seconds"),))
+    finally:
+        conn.close()
+
+
+def maintenance_loop():
+    while not _maintenance_stop.wait(MAINTENANCE_INTERVAL_SECONDS):
+        try:
+            run_maintenance()
+        except Exception:
+            app.logger.exception("Database maintenance failed")
+
+
+def start_maintenance():
+    # Call once per process (see boot_worker). Several workers can
+    # run it side by side: claim_maintenance lets only one of them run each task at a time
+    global _maintenance_thread
+    if _maintenance_thread is None:
+        _maintenance_stop.clear()
+        _maintenance_thread = threading.Thread(target=maintenance_loop, name="db-maintenance", daemon=True)
+        _maintenance_thread.start()
+
+
+def stop_maintenance():
+    global _maintenance_thread
+    _maintenance_stop.set()
+    if _maintenance_thread is not None:
+        _maintenance_thread.join()
+        _maintenance_thread = None
+
+
+def boot_worker():
+    # Everything a serving process needs before its first request. python app.py calls
+    # it; under gunicorn call it from post_fork, e.g. in gunicorn.conf.py:
+    #     def post_fork(server, worker):
+    #         import app
+    #         app.boot_worker()
+    version = migrate_db()
+    if os.environ.get("WARM_UP_PDF") == "1":
+        warm_up()
+    start_maintenance()
+    return version
+
+
 def format_date(date_str):
     try:
         return datetime.strptime(date_str, "%Y-%m-%d").strftime("%d-%m-%Y")
@@ -112,37 +457,218 @@ def calculate_duration(start, end):
         return 0
 
 
-def check_overlap(conn, faculty_id, work_date, start, end, exclude_id=None):
+def find_overlaps(conn, faculty_id, work_date, start, end, exclude_id=None):
+    # Raises ValueError for malformed times
+    s = datetime.strptime(start, "%H:%M")
+    e = datetime.strptime(end, "%H:%M")
+
     cursor = conn.cursor()
-    query = """SELECT id, start_time, end_time FROM daily_workload
-               WHERE faculty_id = ? AND work_date = ?"""
+    query = """SELECT dw.id, dw.subject_id, dw.start_time, dw.end_time, s.name as subject_name
+               FROM daily_workload dw
+               LEFT JOIN subjects s ON dw.subject_id = s.id
+               WHERE dw.faculty_id = ? AND dw.work_date = ?"""
     params = [faculty_id, work_date]
 
     if exclude_id:
-        query += " AND id != ?"
+        query += " AND dw.id != ?"
         params.append(exclude_id)
 
     cursor.execute(query, params)
-    rows = cursor.fetchall()
 
-    try:
-        s = datetime.strptime(start, "%H:%M")
-        e = datetime.strptime(end, "%H:%M")
-    except Exception:
-        return True  # invalid times -> treat as overlap to prevent insertion
-
-    for row in rows:
+    overlaps = []
+    for row in cursor.fetchall():
         es = datetime.strptime(row["start_time"], "%H:%M")
         ee = datetime.strptime(row["end_time"], "%H:%M")
         if s < ee and e > es:
-            return True
+            overlaps.append(dict(row))
+
+    return overlaps
+
+
+def check_overlap(conn, faculty_id, work_date, start, end, exclude_id=None):
+    try:
+        return bool(find_overlaps(conn, faculty_id, work_date, start, end, exclude_id))
+    except ValueError:
+        return True  # invalid times -> treat as overlap to prevent insertion
+
+
+def workload_entry(conn, faculty_id, entry_id):
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT dw.*, s.name as subject_name
+        FROM daily_workload dw
+        JOIN subjects s ON dw.subject_id = s.id
+        WHERE dw.id = ? AND dw.faculty_id = ?
+    """, (entry_id, faculty_id))
+    row = cursor.fetchone()
+    if not row:
+        return None
+
+    entry = dict(row)
+    entry["work_date_formatted"] = format_date(entry["work_date"])
+    return entry
 
-    return False
+
+def month_entries(conn, faculty_id, month):
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT dw.*, s.name as subject_name
+        FROM daily_workload dw
+        JOIN subjects s ON dw.subject_id = s.id
+        WHERE dw.faculty_id = ? AND strftime('%Y-%m', dw.work_date) = ?
+        ORDER BY dw.work_date DESC, dw.start_time ASC
+    """, (faculty_id, month))
+
+    entries = []
+    for row in cursor.fetchall():
+        entry = dict(row)
+        entry["work_date_formatted"] = format_date(entry["work_date"])
+        entries.append(entry)
+
+    return entries
+
+
+def apply_sync_operation(conn, faculty_id, op):
+    if not isinstance(op, dict):
+        return {"op_id": None, "action": None, "status": "error", "message": "Operation must be an object"}
+
+    op_id = op.get("op_id")
+    action = op.get("action")
+    entry_id = op.get("entry_id")
+    result = {"op_id": op_id, "action": action}
+
+    if not op_id or not isinstance(op_id, str) or action not in ("create", "update", "delete"):
+        return {**result, "status": "error", "message": "op_id and a valid action required"}
+
+    cursor = conn.cursor()
+
+    # A retried batch (e.g. the response was lost) must not apply an operation twice
+    cursor.execute("SELECT entry_id FROM applied_ops WHERE op_id = ? AND faculty_id = ?", (op_id, faculty_id))
+    applied = cursor.fetchone()
+    if applied:
+        result["status"] = "ok"
+        if action != "delete":
+            result["entry"] = workload_entry(conn, faculty_id, applied["entry_id"])
+        return result
+
+    if action == "delete":
+        cursor.execute("DELETE FROM daily_workload WHERE id = ? AND faculty_id = ?", (entry_id, faculty_id))
+        if cursor.rowcount == 0:
+            return {**result, "status": "not_found", "message": "Entry not found"}
+    else:
+        data = op.get("data")
+        if not isinstance(data, dict):
+            return {**result, "status": "error", "message": "All fields required"}
+
+        work_date = data.get("date")
+        subject_id = data.get("subject_id")
+        activity_type = data.get("activity_type")
+        start = data.get("start_time")
+        end = data.get("end_time")
+
+        if not all([work_date, subject_id, activity_type, start, end]):
+            return {**result, "status": "error", "message": "All fields required"}
+
+        duration = calculate_duration(start, end)
+        if duration <= 0:
+            return {**result, "status": "error", "message": "End time must be after start time"}
+
+        exclude_id = entry_id if action == "update" else None
+        overlaps = find_overlaps(conn, faculty_id, work_date, start, end, exclude_id=exclude_id)
+        if overlaps:
+            result.update({
+                "status": "conflict",
+                "message": "Time slot overlaps with existing entry",
+                "conflicts": overlaps
+            })
+            if action == "update":
+                result["current"] = workload_entry(conn, faculty_id, entry_id)
+            return result
+
+        rate = SALARY_RATES.get(activity_type, 500)
+        pay = round(duration * rate, 2)
+
+        if action == "create":
+            cursor.execute("""
+                INSERT INTO daily_workload(faculty_id, subject_id, work_date, activity_type,
+                start_time, end_time, duration_hours, hourly_rate, daily_pay)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (faculty_id, subject_id, work_date, activity_type, start, end, duration, rate, pay))
+            entry_id = cursor.lastrowid
+        else:
+            cursor.execute("""
+                UPDATE daily_workload
+                SET subject_id = ?, work_date = ?, activity_type = ?,
+                    start_time = ?, end_time = ?, duration_hours = ?,
+                    hourly_rate = ?, daily_pay = ?
+                WHERE id = ? AND faculty_id = ?
+            """, (subject_id, work_date, activity_type, start, end,
+                  duration, rate, pay, entry_id, faculty_id))
+            if cursor.rowcount == 0:
+                return {**result, "status": "not_found", "message": "Entry not found"}
+
+        result["entry"] = workload_entry(conn, faculty_id, entry_id)
+
+    cursor.execute("""
+        INSERT INTO applied_ops(op_id, faculty_id, entry_id, applied_at)
+        VALUES (?, ?, ?, ?)
+    """, (op_id, faculty_id, entry_id, datetime.now().isoformat(timespec="seconds")))
+
+    result["status"] = "ok"
+    return result
 
 
 @app.route("/")
 def main():
-    return render_template("index.html")
+    html = render_template("index.html").encode("utf-8")
+    response = make_response(html)
+    response.vary.add("Accept-Encoding")
+
+    if request.accept_encodings["gzip"]:
+        response.set_data(gzip.compress(html, compresslevel=6, mtime=0))
+        response.content_encoding = "gzip"
+
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+@app.route("/static/<path:filename>", endpoint="static")
+def static_files(filename):
+    path = safe_join(STATIC_DIR, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    variants = [(name, path + suffix) for name, suffix in STATIC_ENCODINGS
+                if os.path.isfile(path + suffix)]
+
+    encoding = None
+    for name, variant_path in variants:
+        if request.accept_encodings[name]:
+            encoding, path = name, variant_path
+            break
+
+    hashed = filename in HASHED_ASSETS
+    response = send_file(
+        path,
+        mimetype=mimetype,
+        conditional=True,
+        etag=True,
+        max_age=STATIC_MAX_AGE if hashed else None
+    )
+    # send_file always names the file it read (here possibly the .br/.gz variant);
+    # assets are displayed, not downloaded, so the header is dropped
+    response.headers.pop("Content-Disposition", None)
+
+    if hashed:
+        response.cache_control.immutable = True
+    if variants:
+        response.vary.add("Accept-Encoding")
+    if encoding:
+        response.content_encoding = encoding
+
+    return response
 
 
 # AUTH
@@ -338,6 +864,55 @@ def update_workload(faculty_id, entry_id):
         conn.close()
 
 
+@app.route("/api/faculty/<int:faculty_id>/daily-workload/batch", methods=["POST"])
+def sync_workload(faculty_id):
+    data = request.get_json(silent=True)
+    operations = data.get("operations") if isinstance(data, dict) else None
+    month = request.args.get("month")
+
+    if not isinstance(operations, list):
+        return jsonify({"success": False, "message": "Operations list required"}), 400
+
+    if len(operations) > SYNC_BATCH_LIMIT:
+        return jsonify({"success": False, "message": f"At most {SYNC_BATCH_LIMIT} operations per batch"}), 400
+
+    conn = get_db()
+    try:
+        # Operations apply in order inside one transaction, so later ones see earlier ones.
+        # Each runs in its own savepoint: anything but "ok" leaves no trace in the database.
+        conn.execute("BEGIN IMMEDIATE")
+        results = []
+        for op in operations:
+            conn.execute("SAVEPOINT op")
+            try:
+                result = apply_sync_operation(conn, faculty_id, op)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                result = {"op_id": op.get("op_id") if isinstance(op, dict) else None,
+                          "action": op.get("action") if isinstance(op, dict) else None,
+                          "status": "error", "message": str(e)}
+            if result["status"] != "ok":
+                conn.execute("ROLLBACK TO op")
+            conn.execute("RELEASE op")
+            results.append(result)
+
+        conn.execute("DELETE FROM applied_ops WHERE applied_at < ?",
+                     ((datetime.now() - APPLIED_OPS_RETENTION).isoformat(timespec="seconds"),))
+        conn.commit()
+
+        response = {"results": results}
+        if month:
+            entries = month_entries(conn, faculty_id, month)
+            response["entries"] = entries
+            response["total_pay"] = round(sum(entry["daily_pay"] for entry in entries), 2)
+
+        return jsonify({"success": True, "data": response})
+    except Exception as e:
+        conn.rollback()
+        return jsonify({"success": False, "message": str(e)}), 500
+    finally:
+        conn.close()
+
+
 @app.route("/api/faculty/<int:faculty_id>/monthly-summary", methods=["GET"])
 def monthly_summary(faculty_id):
     month = request.args.get("month")
@@ -347,24 +922,8 @@ def monthly_summary(faculty_id):
 
     conn = get_db()
     try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT dw.*, s.name as subject_name
-            FROM daily_workload dw
-            JOIN subjects s ON dw.subject_id = s.id
-            WHERE dw.faculty_id = ? AND strftime('%Y-%m', dw.work_date) = ?
-            ORDER BY dw.work_date DESC, dw.start_time ASC
-        """, (faculty_id, month))
-
-        entries = []
-        total_pay = 0
-
-        for row in cursor.fetchall():
-            entry = dict(row)
-            entry["work_date_formatted"] = format_date(entry["work_date"])
-            entries.append(entry)
-            total_pay += entry["daily_pay"]
+        entries = month_entries(conn, faculty_id, month)
+        total_pay = sum(entry["daily_pay"] for entry in entries)
 
         return jsonify({
             "success": True,
@@ -410,6 +969,14 @@ def generate_receipt(faculty_id):
         if not entries:
             return jsonify({"success": False, "message": "No entries found for this month"}), 404
 
+        # ReportLab is only needed here, so it is imported on first use to keep boot fast
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+        from reportlab.lib.units import inch
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch)
         elements = []
@@ -724,10 +1291,50 @@ def analytics():
         conn.close()
 
 
+@app.route("/api/admin/maintenance", methods=["GET"])
+def maintenance_status():
+    limit = request.args.get("limit", 50, type=int)
+
+    conn = get_db()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM maintenance_log ORDER BY id DESC LIMIT ?", (limit,))
+
+        runs = []
+        for row in cursor.fetchall():
+            run = dict(row)
+            run["details"] = json.loads(run["details"])
+            runs.append(run)
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "wal_bytes": wal_size(),
+                "page_size": pragma_value(conn, "page_size"),
+                "page_count": pragma_value(conn, "page_count"),
+                "free_pages": pragma_value(conn, "freelist_count"),
+                "auto_vacuum": pragma_value(conn, "auto_vacuum"),
+                "runs": runs
+            }
+        })
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+    finally:
+        conn.close()
+
+
 if __name__ == "__main__":
     with app.app_context():
-        init_db()
-        print("Database initialized with WAL mode")
+        if ASSETS_STALE:
+            build_assets.build()
+            load_asset_manifest()
+            print("Rebuilt out-of-date static assets in build/")
+        # with debug=True the reloader re-runs this file; only its child process serves requests
+        if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+            version = boot_worker()
+        else:
+            version = migrate_db()
+        print(f"Database schema at version {version} (WAL mode)")
         print(f"Server starting on http://0.0.0.0:5000")
 
     app.run(host="0.0.0.0", port=5000, debug=True)
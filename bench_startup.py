@@ -0,0 +1,117 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that must stay off the import path of a booting worker
+LAZY_MODULES = ("reportlab",)
+
+BOOT_SNIPPET = """
+import sys, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+app.DATABASE = sys.argv[1]
+app.migrate_db()
+t2 = time.perf_counter()
+app.migrate_db()
+t3 = time.perf_counter()
+print(f"{(t1 - t0) * 1000:.3f} {(t2 - t1) * 1000:.3f} {(t3 - t2) * 1000:.3f}")
+"""
+
+
+def parse_importtime(stderr):
+    # lines look like: "import time:       412 |       1803 |   flask"
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure_import():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_boot(db_path):
+    result = subprocess.run(
+        [sys.executable, "-c", BOOT_SNIPPET, db_path],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True
+    )
+    return [float(x) for x in result.stdout.split()]
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time and boot-time benchmark for app.py")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="fail if the median cumulative import of app exceeds this")
+    parser.add_argument("--max-boot-ms", type=float, default=None,
+                        help="fail if the median migrate_db on a current schema exceeds this")
+    args = parser.parse_args()
+
+    failures = []
+
+    import_runs = [measure_import() for _ in range(args.runs)]
+    modules = import_runs[0]
+    app_us = median([
+        next(cum for name, _, cum in run if name == "app")
+        for run in import_runs
+    ])
+    print(f"import app: {app_us / 1000:.1f} ms cumulative (median of {args.runs})")
+
+    top_level = sorted((m for m in modules if "." not in m[0]), key=lambda m: -m[2])
+    for name, _, cumulative in top_level[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    imported = {name.split(".")[0] for name, _, _ in modules}
+    for lazy in LAZY_MODULES:
+        if lazy in imported:
+            failures.append(f"{lazy} is imported at module load")
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        source_db = os.path.join(BASE_DIR, "billing_system.db")
+        if os.path.exists(source_db):
+            shutil.copy(source_db, db_path)
+
+        runs = []
+        for _ in range(args.runs):
+            runs.append(measure_boot(db_path))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # the first run migrates the copy, later runs only see the current-schema path
+    print(f"first migrate_db: {runs[0][1]:.2f} ms")
+    current_ms = median([r[2] for r in runs])
+    print(f"migrate_db on current schema: {current_ms:.2f} ms (median)")
+
+    if args.max_import_ms is not None and app_us / 1000 > args.max_import_ms:
+        failures.append(f"import app took {app_us / 1000:.1f} ms > {args.max_import_ms} ms")
+    if args.max_boot_ms is not None and current_ms > args.max_boot_ms:
+        failures.append(f"migrate_db took {current_ms:.2f} ms > {args.max_boot_ms} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
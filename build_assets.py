@@ -0,0 +1,103 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BUILD_DIR = os.path.join(BASE_DIR, "build")
+STATIC_OUT = os.path.join(BUILD_DIR, "static")
+TEMPLATES_OUT = os.path.join(BUILD_DIR, "templates")
+
+TEMPLATE = "index.html"
+
+# name referenced by url_for('static', ...) in the template -> source file
+ASSETS = {
+    "style.css": "style.css",
+    "script.js": "script.js",
+    "images/college-logo.jpeg": "img.jpeg",
+}
+
+# already-compressed formats gain nothing from gzip/brotli
+COMPRESSIBLE = (".css", ".js", ".html", ".svg", ".json")
+
+STATIC_REF = re.compile(r"""url_for\(\s*'static'\s*,\s*filename\s*=\s*'([^']+)'\s*\)""")
+
+
+def hashed_name(name, data):
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    root, ext = os.path.splitext(name)
+    return f"{root}.{digest}{ext}"
+
+
+def source_hashes():
+    # Recorded in the manifest so app.py can tell when build/ is out of date
+    hashes = {}
+    for source in sorted(set(ASSETS.values()) | {TEMPLATE}):
+        with open(os.path.join(BASE_DIR, source), "rb") as f:
+            hashes[source] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def write_variants(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+    if not path.endswith(COMPRESSIBLE):
+        return
+
+    # mtime=0 keeps the .gz output byte-for-byte reproducible between builds
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def build():
+    if os.path.isdir(BUILD_DIR):
+        shutil.rmtree(BUILD_DIR)
+    os.makedirs(STATIC_OUT)
+    os.makedirs(TEMPLATES_OUT)
+
+    manifest = {}
+    for name, source in ASSETS.items():
+        with open(os.path.join(BASE_DIR, source), "rb") as f:
+            data = f.read()
+
+        out_name = hashed_name(name, data)
+        out_path = os.path.join(STATIC_OUT, out_name)
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        write_variants(out_path, data)
+        manifest[name] = out_name
+
+    with open(os.path.join(BASE_DIR, TEMPLATE), encoding="utf-8") as f:
+        html = f.read()
+
+    def rewrite(match):
+        name = match.group(1)
+        if name not in manifest:
+            raise KeyError(f"Template references unknown static asset: {name}")
+        return f"url_for('static', filename='{manifest[name]}')"
+
+    with open(os.path.join(TEMPLATES_OUT, TEMPLATE), "w", encoding="utf-8") as f:
+        f.write(STATIC_REF.sub(rewrite, html))
+
+    with open(os.path.join(STATIC_OUT, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({"assets": manifest, "sources": source_hashes()}, f, indent=2, sort_keys=True)
+
+    return manifest
+
+
+if __name__ == "__main__":
+    for name, out_name in build().items():
+        print(f"{name} -> {out_name}")
+    if brotli is None:
+        print("brotli not installed, skipped .br variants")
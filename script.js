@@ -118,6 +118,7 @@ async function handleRegister(event) {
 function logout() {
     currentUser = null;
     currentFacultyId = null;
+    facultySubjects = [];
     showPage('auth-page');
     clearAlerts();
 }
@@ -149,50 +150,445 @@ function showAdminTab(tabName) {
     else if (tabName === 'analytics') loadAnalytics();
 }
 
+// ============= OFFLINE STORE =============
+// Subjects and workload entries are cached in IndexedDB so the faculty pages render
+// without waiting on the network. Edits are applied to the cache straight away and
+// queued; the queue is flushed to the batch endpoint in the background.
+const IDB_NAME = 'faculty-workload';
+const IDB_VERSION = 1;
+const SYNC_DELAY_MS = 1000;
+const SYNC_RETRY_MS = 15000;
+const SYNC_BATCH_SIZE = 50;
+
+let idbPromise = null;
+let facultySubjects = [];
+let syncTimer = null;
+let syncRunning = null;
+let storeUsable = null;
+
+function openStore() {
+    if (!idbPromise) {
+        idbPromise = new Promise((resolve, reject) => {
+            const req = indexedDB.open(IDB_NAME, IDB_VERSION);
+            req.onupgradeneeded = () => {
+                const db = req.result;
+                db.createObjectStore('profiles', { keyPath: 'email' });
+                db.createObjectStore('subjects', { keyPath: 'id' }).createIndex('faculty_id', 'faculty_id');
+                db.createObjectStore('entries', { keyPath: 'id' }).createIndex('faculty_month', ['faculty_id', 'month']);
+                db.createObjectStore('queue', { keyPath: 'seq', autoIncrement: true });
+            };
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+        });
+    }
+    return idbPromise;
+}
+
+// Private browsing or disabled storage can make IndexedDB unusable; the faculty
+// pages then talk to the server directly, as they did before the local cache
+async function useStore() {
+    if (storeUsable === null) {
+        try {
+            await openStore();
+            storeUsable = true;
+        } catch (error) {
+            console.warn('IndexedDB unavailable, working online only:', error);
+            storeUsable = false;
+        }
+    }
+    return storeUsable;
+}
+
+function idbRequest(req) {
+    return new Promise((resolve, reject) => {
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+    });
+}
+
+// Runs fn with the named object stores in a single transaction and resolves once it commits
+async function withStores(names, mode, fn) {
+    const db = await openStore();
+    const tx = db.transaction(names, mode);
+    const done = new Promise((resolve, reject) => {
+        tx.oncomplete = resolve;
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error);
+    });
+    let result;
+    try {
+        result = await fn(...names.map(n => tx.objectStore(n)));
+    } catch (err) {
+        done.catch(() => {});
+        try { tx.abort(); } catch (_) { /* already finished */ }
+        throw err;
+    }
+    await done;
+    return result;
+}
+
+function entryMonth(workDate) {
+    return workDate.slice(0, 7);
+}
+
+function viewedMonth() {
+    const historyMonth = document.getElementById('history-month');
+    return (historyMonth && historyMonth.value) || new Date().toISOString().slice(0, 7);
+}
+
+// Entries that only exist locally get negative ids until the server assigns one
+function nextLocalId() {
+    return -(Date.now() * 1000 + Math.floor(Math.random() * 1000));
+}
+
+function newOpId() {
+    if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+    return `${Date.now()}-${Math.random().toString(16).slice(2)}`;
+}
+
+function serverEntry(entry) {
+    return { ...entry, month: entryMonth(entry.work_date), pending: false };
+}
+
+function localEntry(facultyId, id, data) {
+    const hours = parseFloat(calculateDuration(data.start_time, data.end_time));
+    const rate = SALARY_RATES[data.activity_type] || 500;
+    const [y, m, d] = data.date.split('-');
+    return {
+        id,
+        faculty_id: facultyId,
+        subject_id: Number(data.subject_id),
+        subject_name: data.subject_name,
+        work_date: data.date,
+        work_date_formatted: `${d}-${m}-${y}`,
+        month: entryMonth(data.date),
+        activity_type: data.activity_type,
+        start_time: data.start_time,
+        end_time: data.end_time,
+        duration_hours: hours,
+        hourly_rate: rate,
+        daily_pay: Math.round(hours * rate * 100) / 100,
+        pending: true
+    };
+}
+
+function applyOpLocally(entries, op) {
+    if (op.action === 'delete') return idbRequest(entries.delete(op.entry_id));
+    return idbRequest(entries.put(localEntry(op.faculty_id, op.entry_id, op.data)));
+}
+
+// Swap a month's cached entries for the server's copy, then re-apply edits still queued
+async function replaceMonth(entries, queue, facultyId, month, serverEntries) {
+    const stale = await idbRequest(entries.index('faculty_month').getAllKeys([facultyId, month]));
+    for (const key of stale) await idbRequest(entries.delete(key));
+    for (const entry of serverEntries) await idbRequest(entries.put(serverEntry(entry)));
+    for (const op of await idbRequest(queue.getAll())) {
+        if (op.faculty_id === facultyId) await applyOpLocally(entries, op);
+    }
+}
+
+async function loadMonthEntries(facultyId, month) {
+    if (!(await useStore())) {
+        const response = await fetch(`/api/faculty/${facultyId}/monthly-summary?month=${month}`);
+        const result = await response.json();
+        return result.success && result.data ? result.data.entries : [];
+    }
+    const entries = await withStores(['entries'], 'readonly',
+        store => idbRequest(store.index('faculty_month').getAll([facultyId, month])));
+    return entries.sort((a, b) =>
+        b.work_date.localeCompare(a.work_date) || a.start_time.localeCompare(b.start_time));
+}
+
+// Same rule as check_overlap on the server, so most clashes are caught before queueing
+function findLocalOverlap(entries, date, start, end, excludeId) {
+    return entries.find(e => e.id !== excludeId && e.work_date === date &&
+        start < e.end_time && end > e.start_time);
+}
+
+// Used when IndexedDB is unavailable: the same requests the page made before offline support
+async function sendChangeDirectly(action, entryId, data) {
+    const url = `/api/faculty/${currentFacultyId}/daily-workload` + (action === 'create' ? '' : `/${entryId}`);
+    const options = action === 'delete' ? { method: 'DELETE' } : {
+        method: action === 'create' ? 'POST' : 'PUT', headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(data)
+    };
+    const response = await fetch(url, options);
+    const result = await response.json();
+    if (!result.success) throw new Error(result.message || 'Request failed');
+    afterWorkloadChange();
+}
+
+async function queueChange(action, entryId, data) {
+    if (!(await useStore())) return sendChangeDirectly(action, entryId, data);
+
+    const op = { op_id: newOpId(), faculty_id: currentFacultyId, action, entry_id: entryId, data, sent: false };
+    await withStores(['entries', 'queue'], 'readwrite', async (entries, queue) => {
+        // Fold the change into earlier queued ops for the same entry, but never into one that
+        // has been sent: the server may already have applied it under that op_id
+        const unsent = (await idbRequest(queue.getAll()))
+            .filter(p => p.entry_id === entryId && !p.sent);
+        const last = unsent[unsent.length - 1];
+
+        if (last && action === 'update' && last.action !== 'delete') {
+            last.data = data;
+            await idbRequest(queue.put(last));
+        } else if (last && action === 'delete' && unsent.some(p => p.action === 'create')) {
+            for (const p of unsent) await idbRequest(queue.delete(p.seq));
+        } else if (last && action === 'delete' && last.action === 'update') {
+            last.action = 'delete';
+            last.data = null;
+            await idbRequest(queue.put(last));
+        } else {
+            await idbRequest(queue.add(op));
+        }
+        await applyOpLocally(entries, op);
+    });
+    scheduleSync(SYNC_DELAY_MS);
+}
+
+function scheduleSync(delay) {
+    clearTimeout(syncTimer);
+    syncTimer = setTimeout(syncQueue, delay);
+}
+
+function syncQueue() {
+    if (!syncRunning) {
+        syncRunning = (async () => {
+            try {
+                while (await sendNextBatch()) { /* keep flushing until the queue is empty */ }
+            } catch (error) {
+                console.warn('Sync failed, retrying later:', error);
+                scheduleSync(SYNC_RETRY_MS);
+            } finally {
+                syncRunning = null;
+            }
+        })();
+    }
+    return syncRunning;
+}
+
+async function sendNextBatch() {
+    if (!navigator.onLine || !(await useStore())) return false;
+
+    // Mark the batch as sent before it leaves, in the same transaction that picks it, so
+    // queueChange can no longer fold edits into it even if the response is lost
+    const batch = await withStores(['queue'], 'readwrite', async queue => {
+        const pending = await idbRequest(queue.getAll());
+        if (pending.length === 0) return [];
+        // Ops on a local id wait until the create's result gives them the server id
+        const sendable = p => p.action === 'create' || p.entry_id > 0;
+        const first = pending.find(sendable);
+        if (!first) return [];
+        const picked = pending
+            .filter(p => p.faculty_id === first.faculty_id && sendable(p))
+            .slice(0, SYNC_BATCH_SIZE);
+        for (const p of picked) {
+            p.sent = true;
+            await idbRequest(queue.put(p));
+        }
+        return picked;
+    });
+    if (batch.length === 0) return false;
+    const facultyId = batch[0].faculty_id;
+
+    // Ask for the viewed month back so the cache is refreshed without another request
+    const month = facultyId === currentFacultyId ? viewedMonth() : null;
+    const response = await fetch(`/api/faculty/${facultyId}/daily-workload/batch${month ? `?month=${month}` : ''}`, {
+        method: 'POST', headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            operations: batch.map(({ op_id, action, entry_id, data }) => ({ op_id, action, entry_id, data }))
+        })
+    });
+    const result = await response.json();
+    if (!result.success) throw new Error(result.message || 'Sync failed');
+
+    const rejected = await applySyncResults(facultyId, batch, result.data, month);
+
+    if (facultyId === currentFacultyId) {
+        await renderFromStore();
+        afterWorkloadChange();
+    }
+    if (rejected.length > 0) reportRejected(rejected);
+    return true;
+}
+
+async function applySyncResults(facultyId, batch, data, month) {
+    const results = new Map(data.results.map(r => [r.op_id, r]));
+    const rejected = [];
+
+    await withStores(['entries', 'queue'], 'readwrite', async (entries, queue) => {
+        const remapped = new Map();
+        const dropped = new Set();
+
+        for (const op of batch) {
+            await idbRequest(queue.delete(op.seq));
+            const res = results.get(op.op_id);
+            if (!res) {
+                // No result means the create never landed, so later ops on its local id can't either
+                if (op.action === 'create') {
+                    await idbRequest(entries.delete(op.entry_id));
+                    dropped.add(op.entry_id);
+                }
+                continue;
+            }
+
+            if (res.status === 'ok') {
+                if (op.action === 'delete' || !res.entry) {
+                    await idbRequest(entries.delete(op.entry_id));
+                    if (op.action === 'create') dropped.add(op.entry_id);
+                    continue;
+                }
+                if (res.entry.id !== op.entry_id) {
+                    await idbRequest(entries.delete(op.entry_id));
+                    remapped.set(op.entry_id, res.entry.id);
+                }
+                await idbRequest(entries.put(serverEntry(res.entry)));
+            } else if (op.action === 'delete' && res.status === 'not_found') {
+                await idbRequest(entries.delete(op.entry_id));
+            } else {
+                // The server copy wins: undo the optimistic change and tell the user
+                rejected.push({ op, res });
+                if (op.action === 'create') {
+                    await idbRequest(entries.delete(op.entry_id));
+                    dropped.add(op.entry_id);
+                } else if (res.current) {
+                    await idbRequest(entries.put(serverEntry(res.current)));
+                } else if (res.status === 'not_found') {
+                    await idbRequest(entries.delete(op.entry_id));
+                }
+            }
+        }
+
+        // Ops queued while this batch was in flight may still refer to local ids
+        for (const p of await idbRequest(queue.getAll())) {
+            if (dropped.has(p.entry_id)) {
+                await idbRequest(queue.delete(p.seq));
+                await idbRequest(entries.delete(p.entry_id));
+            } else if (remapped.has(p.entry_id)) {
+                p.entry_id = remapped.get(p.entry_id);
+                await idbRequest(queue.put(p));
+            }
+        }
+
+        if (month && data.entries) {
+            await replaceMonth(entries, queue, facultyId, month, data.entries);
+        }
+    });
+
+    return rejected;
+}
+
+function reportRejected(rejected) {
+    const lines = rejected.map(({ op, res }) => {
+        const d = op.data;
+        let line = d ? `${d.date} ${d.start_time}-${d.end_time}: ` : `Entry ${op.entry_id}: `;
+        line += res.message || 'Rejected by server';
+        if (res.conflicts && res.conflicts.length > 0) {
+            line += ' (' + res.conflicts.map(c => `${c.subject_name || 'Subject'} ${c.start_time}-${c.end_time}`).join(', ') + ')';
+        }
+        return line;
+    });
+    alert('Some changes could not be saved and were reverted:\n' + lines.join('\n'));
+}
+
+// Pull a month from the server unless local edits are waiting; the flush returns it instead
+async function refreshMonthFromServer(month) {
+    const facultyId = currentFacultyId;
+    if (!facultyId) return;
+    if (!(await useStore())) return;  // renderFromStore already read it from the server
+    const pending = await withStores(['queue'], 'readonly', queue => idbRequest(queue.getAll()));
+    if (pending.some(p => p.faculty_id === facultyId)) return syncQueue();
+
+    const response = await fetch(`/api/faculty/${facultyId}/monthly-summary?month=${month}`);
+    const result = await response.json();
+    if (result.success && result.data) {
+        await withStores(['entries', 'queue'], 'readwrite',
+            (entries, queue) => replaceMonth(entries, queue, facultyId, month, result.data.entries));
+        if (facultyId === currentFacultyId) await renderFromStore();
+    }
+}
+
+window.addEventListener('online', () => syncQueue());
+
 // ============= FACULTY =============
 
-// Load faculty dashboard by querying the backend for the faculty with the logged-in user's email
+// Load faculty dashboard by querying the backend for the faculty with the logged-in user's email.
+// A cached profile is shown first so the dashboard renders immediately, even offline.
 async function loadFacultyDashboard() {
     if (!currentUser || !currentUser.email) {
         console.warn('No currentUser or email available');
         return;
     }
 
+    const email = currentUser.email;
+    const cache = await useStore();
+    let cached = null;
+    try {
+        if (cache) cached = await withStores(['profiles'], 'readonly', profiles => idbRequest(profiles.get(email)));
+        if (cached) await showFacultyProfile(cached.faculty);
+    } catch (error) {
+        console.warn('Local cache unavailable:', error);
+    }
+
     try {
-        const response = await fetch(`/api/admin/faculty?email=${encodeURIComponent(currentUser.email)}`);
+        const response = await fetch(`/api/admin/faculty?email=${encodeURIComponent(email)}`);
         const result = await response.json();
 
         if (result.success) {
             const faculty = result.data;
             if (faculty) {
-                currentFacultyId = faculty.id;
-                document.getElementById('fac-name-display').textContent = faculty.name;
-                await updateFacultyOverview();
+                if (cache) await withStores(['profiles'], 'readwrite', profiles => idbRequest(profiles.put({ email, faculty })));
+                await showFacultyProfile(faculty);
+                refreshFacultyData();
                 return;
             }
+            if (cache) await withStores(['profiles'], 'readwrite', profiles => idbRequest(profiles.delete(email)));
         }
         currentFacultyId = null;
         alert('Faculty profile not found. Contact admin.');
     } catch (error) {
+        if (cached) return;  // offline: keep working from the cache
         console.error('Error loading faculty dashboard:', error);
         alert('Error loading faculty profile. Check console.');
     }
 }
 
+async function showFacultyProfile(faculty) {
+    currentFacultyId = faculty.id;
+    document.getElementById('fac-name-display').textContent = faculty.name;
+    if (await useStore()) {
+        facultySubjects = await withStores(['subjects'], 'readonly',
+            subjects => idbRequest(subjects.index('faculty_id').getAll(faculty.id)));
+    }
+    renderSubjectOptions();
+    await renderFromStore();
+}
+
+// Revalidate the cache in the background; the UI has already rendered from it
+function refreshFacultyData() {
+    loadFacultySubjects();
+    const current = new Date().toISOString().slice(0, 7);
+    const months = new Set([current, viewedMonth()]);
+    months.forEach(month => refreshMonthFromServer(month).catch(error => console.warn('Refresh failed:', error)));
+}
+
+async function renderFromStore() {
+    if (!currentFacultyId) return;
+    await updateFacultyOverview();
+    await renderHistory(await loadMonthEntries(currentFacultyId, viewedMonth()));
+}
+
 async function updateFacultyOverview() {
     if (!currentFacultyId) return;
     try {
         const month = new Date().toISOString().slice(0, 7);
-        const response = await fetch(`/api/faculty/${currentFacultyId}/monthly-summary?month=${month}`);
-        const result = await response.json();
-        if (result.success && result.data) {
-            const data = result.data;
-            const uniqueDates = new Set(data.entries.map(e => e.work_date)).size;
-            const totalHours = data.entries.reduce((sum, e) => sum + e.duration_hours, 0);
-            document.getElementById('fac-total-days').textContent = uniqueDates;
-            document.getElementById('fac-total-hours').textContent = totalHours.toFixed(2);
-            document.getElementById('fac-total-pay').textContent = '₹' + data.total_pay.toLocaleString('en-IN');
-        }
+        const entries = await loadMonthEntries(currentFacultyId, month);
+        const uniqueDates = new Set(entries.map(e => e.work_date)).size;
+        const totalHours = entries.reduce((sum, e) => sum + e.duration_hours, 0);
+        const totalPay = entries.reduce((sum, e) => sum + e.daily_pay, 0);
+        document.getElementById('fac-total-days').textContent = uniqueDates;
+        document.getElementById('fac-total-hours').textContent = totalHours.toFixed(2);
+        document.getElementById('fac-total-pay').textContent = '₹' + totalPay.toLocaleString('en-IN');
     } catch (error) {
         console.error('Error updating overview:', error);
     }
@@ -200,21 +596,47 @@ async function updateFacultyOverview() {
 
 async function loadFacultySubjects() {
     if (!currentFacultyId) return;
+    const facultyId = currentFacultyId;
     try {
-        const response = await fetch(`/api/faculty/${currentFacultyId}/subjects`);
+        const response = await fetch(`/api/faculty/${facultyId}/subjects`);
         const result = await response.json();
         if (result.success && result.data) {
-            const select = document.getElementById('entry-subject');
-            select.innerHTML = '<option value="">Select Subject</option>';
-            result.data.forEach(s => {
-                select.innerHTML += `<option value="${s.id}">${s.name}</option>`;
+            if (await useStore()) await withStores(['subjects'], 'readwrite', async subjects => {
+                const stale = await idbRequest(subjects.index('faculty_id').getAllKeys(facultyId));
+                for (const key of stale) await idbRequest(subjects.delete(key));
+                for (const s of result.data) await idbRequest(subjects.put(s));
             });
+            if (facultyId !== currentFacultyId) return;
+            facultySubjects = result.data;
+            renderSubjectOptions();
         }
     } catch (error) {
         console.error('Error loading subjects:', error);
     }
 }
 
+function subjectOptions(selectedSubjectId) {
+    let html = '<option value="">Select Subject</option>';
+    facultySubjects.forEach(s => {
+        const sel = s.id === selectedSubjectId ? 'selected' : '';
+        html += `<option value="${s.id}" ${sel}>${s.name}</option>`;
+    });
+    return html;
+}
+
+function renderSubjectOptions() {
+    document.querySelectorAll('#entry-subject, [id^="edit-subject-"]').forEach(select => {
+        const selected = select.value || select.dataset.subject || '';
+        select.innerHTML = subjectOptions();
+        select.value = selected;
+    });
+}
+
+function subjectName(subjectId) {
+    const subject = facultySubjects.find(s => String(s.id) === String(subjectId));
+    return subject ? subject.name : '';
+}
+
 function calculateDuration(startTime, endTime) {
     if (!startTime || !endTime) return 0;
     const [sh, sm] = startTime.split(':').map(Number);
@@ -240,6 +662,13 @@ function updatePreview() {
     document.getElementById('preview-box').style.display = 'block';
 }
 
+function afterWorkloadChange() {
+    if (document.getElementById('admin-page').classList.contains('active')) {
+        loadAdminDashboard();
+        loadWorkloadSummary();
+    }
+}
+
 async function handleAddEntry(event) {
     event.preventDefault();
     if (!currentFacultyId) return alert('Faculty not loaded');
@@ -252,151 +681,126 @@ async function handleAddEntry(event) {
     const hours = parseFloat(calculateDuration(start_time, end_time));
     if (hours <= 0) return alert('End time must be after start time');
     try {
-        const response = await fetch(`/api/faculty/${currentFacultyId}/daily-workload`, {
-            method: 'POST', headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ date, subject_id, activity_type, start_time, end_time })
-        });
-        const result = await response.json();
-        if (result.success) {
-            alert('Entry saved successfully!');
-            document.getElementById('entry-form').reset();
-            const today = new Date().toISOString().split('T')[0];
-            document.getElementById('entry-date').value = today;
-            document.getElementById('preview-box').style.display = 'none';
-            await updateFacultyOverview();
-            await refreshHistory();
-            if (document.getElementById('admin-page').classList.contains('active')) {
-                loadAdminDashboard();
-                loadWorkloadSummary();
-            }
-        } else {
-            alert('Error: ' + (result.message || 'Failed to save'));
+        const sameMonth = await loadMonthEntries(currentFacultyId, entryMonth(date));
+        if (findLocalOverlap(sameMonth, date, start_time, end_time)) {
+            return alert('Error: Time slot overlaps with existing entry');
         }
+        await queueChange('create', nextLocalId(), {
+            date, subject_id, subject_name: subjectName(subject_id), activity_type, start_time, end_time
+        });
+        alert('Entry saved successfully!');
+        document.getElementById('entry-form').reset();
+        const today = new Date().toISOString().split('T')[0];
+        document.getElementById('entry-date').value = today;
+        document.getElementById('preview-box').style.display = 'none';
+        await renderFromStore();
     } catch (error) { alert('Error: ' + error.message); }
 }
 
 async function refreshHistory() {
     if (!currentFacultyId) return;
-    const month = document.getElementById('history-month').value;
+    await renderFromStore();
+    refreshMonthFromServer(viewedMonth()).catch(error => console.warn('Refresh failed:', error));
+}
+
+async function renderHistory(entries) {
     try {
-        const response = await fetch(`/api/faculty/${currentFacultyId}/monthly-summary?month=${month}`);
-        const result = await response.json();
-        if (result.success && result.data) {
-            const data = result.data;
-            const container = document.getElementById('history-container');
-            if (data.entries.length === 0) {
-                container.innerHTML = '<p style="text-align: center; color: #999; padding: 40px;">No entries for this month</p>';
-                return;
-            }
-            container.innerHTML = '';
-            data.entries.forEach(entry => {
-                const activityLabel = entry.activity_type.charAt(0).toUpperCase() + entry.activity_type.slice(1);
-                container.innerHTML += `
-                    <div class="form-card" id="entry-card-${entry.id}">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-                            <h6 style="color: var(--primary); margin: 0;">${entry.work_date_formatted} - <span class="entry-subject">${entry.subject_name}</span></h6>
+        const container = document.getElementById('history-container');
+        if (entries.length === 0) {
+            container.innerHTML = '<p style="text-align: center; color: #999; padding: 40px;">No entries for this month</p>';
+            return;
+        }
+        container.innerHTML = '';
+        entries.forEach(entry => {
+            const activityLabel = entry.activity_type.charAt(0).toUpperCase() + entry.activity_type.slice(1);
+            const pendingBadge = entry.pending ? ' <small style="color: #999;" title="Waiting to sync"><i class="fas fa-clock"></i> Pending</small>' : '';
+            container.innerHTML += `
+                <div class="form-card" id="entry-card-${entry.id}">
+                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
+                        <h6 style="color: var(--primary); margin: 0;">${entry.work_date_formatted} - <span class="entry-subject">${entry.subject_name}</span>${pendingBadge}</h6>
+                        <div>
+                            <button class="btn btn-sm btn-outline-primary" onclick="startEdit(${entry.id})"><i class="fas fa-edit"></i> Edit</button>
+                            <button class="btn btn-danger btn-sm" onclick="deleteEntry(${entry.id})">Delete</button>
+                        </div>
+                    </div>
+                    <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 15px; align-items:center;">
+                        <div>
+                            <small style="color: #666;">Activity Type</small>
+                            <div class="entry-activity" data-value="${entry.activity_type}" id="activity-display-${entry.id}">${activityLabel}</div>
+                        </div>
+                        <div>
+                            <small style="color: #666;">Time</small>
+                            <div class="entry-time" id="time-display-${entry.id}">${entry.start_time} - ${entry.end_time}</div>
+                        </div>
+                        <div>
+                            <small style="color: #666;">Duration</small>
+                            <div class="entry-duration" id="duration-display-${entry.id}">${entry.duration_hours.toFixed(2)} hrs</div>
+                        </div>
+                        <div>
+                            <small style="color: #666;">Daily Pay</small>
+                            <div style="font-size: 18px; color: var(--success); font-weight: bold;">₹${entry.daily_pay.toLocaleString('en-IN')}</div>
+                        </div>
+                    </div>
+                    <!-- hidden edit form -->
+                    <div id="edit-form-${entry.id}" style="display:none; margin-top:15px;">
+                        <div style="display:grid; grid-template-columns: repeat(4,1fr); gap:12px;">
                             <div>
-                                <button class="btn btn-sm btn-outline-primary" onclick="startEdit(${entry.id})"><i class="fas fa-edit"></i> Edit</button>
-                                <button class="btn btn-danger btn-sm" onclick="deleteEntry(${entry.id})">Delete</button>
+                                <label>Date</label>
+                                <input type="date" id="edit-date-${entry.id}" class="form-control" value="${entry.work_date}">
                             </div>
-                        </div>
-                        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 15px; align-items:center;">
                             <div>
-                                <small style="color: #666;">Activity Type</small>
-                                <div class="entry-activity" data-value="${entry.activity_type}" id="activity-display-${entry.id}">${activityLabel}</div>
+                                <label>Subject</label>
+                                <select id="edit-subject-${entry.id}" class="form-control" data-subject="${entry.subject_id}">${subjectOptions(entry.subject_id)}</select>
                             </div>
                             <div>
-                                <small style="color: #666;">Time</small>
-                                <div class="entry-time" id="time-display-${entry.id}">${entry.start_time} - ${entry.end_time}</div>
+                                <label>Activity</label>
+                                <select id="edit-activity-${entry.id}" class="form-control">
+                                    <option value="lecture">Lecture (₹500/hr)</option>
+                                    <option value="tutorial">Tutorial (₹300/hr)</option>
+                                    <option value="lab">Lab Session (₹400/hr)</option>
+                                </select>
                             </div>
                             <div>
-                                <small style="color: #666;">Duration</small>
-                                <div class="entry-duration" id="duration-display-${entry.id}">${entry.duration_hours.toFixed(2)} hrs</div>
+                                <label>Start</label>
+                                <input type="time" id="edit-start-${entry.id}" class="form-control">
                             </div>
                             <div>
-                                <small style="color: #666;">Daily Pay</small>
-                                <div style="font-size: 18px; color: var(--success); font-weight: bold;">₹${entry.daily_pay.toLocaleString('en-IN')}</div>
+                                <label>End</label>
+                                <input type="time" id="edit-end-${entry.id}" class="form-control">
                             </div>
                         </div>
-                        <!-- hidden edit form -->
-                        <div id="edit-form-${entry.id}" style="display:none; margin-top:15px;">
-                            <div style="display:grid; grid-template-columns: repeat(4,1fr); gap:12px;">
-                                <div>
-                                    <label>Date</label>
-                                    <input type="date" id="edit-date-${entry.id}" class="form-control" value="${entry.work_date}">
-                                </div>
-                                <div>
-                                    <label>Subject</label>
-                                    <select id="edit-subject-${entry.id}" class="form-control"></select>
-                                </div>
-                                <div>
-                                    <label>Activity</label>
-                                    <select id="edit-activity-${entry.id}" class="form-control">
-                                        <option value="lecture">Lecture (₹500/hr)</option>
-                                        <option value="tutorial">Tutorial (₹300/hr)</option>
-                                        <option value="lab">Lab Session (₹400/hr)</option>
-                                    </select>
-                                </div>
-                                <div>
-                                    <label>Start</label>
-                                    <input type="time" id="edit-start-${entry.id}" class="form-control">
-                                </div>
-                                <div>
-                                    <label>End</label>
-                                    <input type="time" id="edit-end-${entry.id}" class="form-control">
-                                </div>
-                            </div>
-                            <div style="margin-top:10px; display:flex; gap:10px;">
-                                <button class="btn btn-success" onclick="saveEdit(${entry.id})">Save</button>
-                                <button class="btn btn-secondary" onclick="cancelEdit(${entry.id})">Cancel</button>
-                            </div>
+                        <div style="margin-top:10px; display:flex; gap:10px;">
+                            <button class="btn btn-success" onclick="saveEdit(${entry.id})">Save</button>
+                            <button class="btn btn-secondary" onclick="cancelEdit(${entry.id})">Cancel</button>
                         </div>
                     </div>
-                `;
-            });
-            for (const e of data.entries) {
-                await populateEditSubjects(e.id, e.subject_id);
-                const activityEl = document.getElementById(`edit-activity-${e.id}`);
-                if (activityEl) activityEl.value = e.activity_type;
-                const startEl = document.getElementById(`edit-start-${e.id}`);
-                const endEl = document.getElementById(`edit-end-${e.id}`);
-                if (startEl) startEl.value = e.start_time;
-                if (endEl) endEl.value = e.end_time;
-            }
-
-            const totalHours = data.entries.reduce((sum, e) => sum + e.duration_hours, 0);
-            container.innerHTML += `
-                <div class="form-card" style="background: linear-gradient(135deg, rgba(0, 102, 204, 0.05) 0%, rgba(0, 102, 204, 0.02) 100%); border-left-color: var(--secondary);">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <h6 style="color: var(--secondary); margin: 0;">Total Hours: ${totalHours.toFixed(2)}</h6>
-                        <h6 style="color: var(--secondary); margin: 0;">Monthly Total: ₹${data.total_pay.toLocaleString('en-IN')}</h6>
-                    </div>
                 </div>
             `;
+        });
+        for (const e of entries) {
+            const activityEl = document.getElementById(`edit-activity-${e.id}`);
+            if (activityEl) activityEl.value = e.activity_type;
+            const startEl = document.getElementById(`edit-start-${e.id}`);
+            const endEl = document.getElementById(`edit-end-${e.id}`);
+            if (startEl) startEl.value = e.start_time;
+            if (endEl) endEl.value = e.end_time;
         }
+
+        const totalHours = entries.reduce((sum, e) => sum + e.duration_hours, 0);
+        const totalPay = Math.round(entries.reduce((sum, e) => sum + e.daily_pay, 0) * 100) / 100;
+        container.innerHTML += `
+            <div class="form-card" style="background: linear-gradient(135deg, rgba(0, 102, 204, 0.05) 0%, rgba(0, 102, 204, 0.02) 100%); border-left-color: var(--secondary);">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <h6 style="color: var(--secondary); margin: 0;">Total Hours: ${totalHours.toFixed(2)}</h6>
+                    <h6 style="color: var(--secondary); margin: 0;">Monthly Total: ₹${totalPay.toLocaleString('en-IN')}</h6>
+                </div>
+            </div>
+        `;
     } catch (error) {
         console.error('Error loading history:', error);
     }
 }
 
-async function populateEditSubjects(entryId, selectedSubjectId) {
-    try {
-        const response = await fetch(`/api/faculty/${currentFacultyId}/subjects`);
-        const result = await response.json();
-        if (result.success) {
-            const select = document.getElementById(`edit-subject-${entryId}`);
-            if (!select) return;
-            select.innerHTML = '<option value="">Select Subject</option>';
-            result.data.forEach(s => {
-                const sel = s.id === selectedSubjectId ? 'selected' : '';
-                select.innerHTML += `<option value="${s.id}" ${sel}>${s.name}</option>`;
-            });
-        }
-    } catch (err) {
-        console.error('Error populating edit subjects', err);
-    }
-}
-
 function startEdit(entryId) {
     document.getElementById(`edit-form-${entryId}`).style.display = 'block';
     document.getElementById(`activity-display-${entryId}`).style.display = 'none';
@@ -422,24 +826,16 @@ async function saveEdit(entryId) {
     if (hours <= 0) return alert('End time must be after start time');
 
     try {
-        const response = await fetch(`/api/faculty/${currentFacultyId}/daily-workload/${entryId}`, {
-            method: 'PUT',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ date, subject_id, activity_type, start_time, end_time })
-        });
-        const result = await response.json();
-        if (result.success) {
-            alert('Entry updated');
-            cancelEdit(entryId);
-            await refreshHistory();
-            await updateFacultyOverview();
-            if (document.getElementById('admin-page').classList.contains('active')) {
-                loadAdminDashboard();
-                loadWorkloadSummary();
-            }
-        } else {
-            alert('Error: ' + (result.message || 'Failed to update'));
+        const sameMonth = await loadMonthEntries(currentFacultyId, entryMonth(date));
+        if (findLocalOverlap(sameMonth, date, start_time, end_time, entryId)) {
+            return alert('Error: Time slot overlaps with another entry');
         }
+        await queueChange('update', entryId, {
+            date, subject_id, subject_name: subjectName(subject_id), activity_type, start_time, end_time
+        });
+        alert('Entry updated');
+        cancelEdit(entryId);
+        await renderFromStore();
     } catch (err) {
         alert('Error: ' + err.message);
     }
@@ -448,19 +844,9 @@ async function saveEdit(entryId) {
 async function deleteEntry(entryId) {
     if (!confirm('Delete this entry?')) return;
     try {
-        const response = await fetch(`/api/faculty/${currentFacultyId}/daily-workload/${entryId}`, { method: 'DELETE' });
-        const result = await response.json();
-        if (result.success) {
-            alert('Entry deleted!');
-            await refreshHistory();
-            await updateFacultyOverview();
-            if (document.getElementById('admin-page').classList.contains('active')) {
-                loadAdminDashboard();
-                loadWorkloadSummary();
-            }
-        } else {
-            alert('Error: ' + (result.message || 'Failed to delete'));
-        }
+        await queueChange('delete', entryId, null);
+        alert('Entry deleted!');
+        await renderFromStore();
     } catch (error) {
         alert('Error: ' + error.message);
     }